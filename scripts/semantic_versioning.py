@@ -12,7 +12,7 @@ import pathlib
 import re
 import subprocess
 import sys
-from typing import Dict, List, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 # ---- LEVEL MAP (kept as requested) ------------------------------------------
 LEVEL_MAP: Dict[str, str] = {
@@ -24,7 +24,7 @@ LEVEL_MAP: Dict[str, str] = {
     "NA":    "NA",     # for things like New lines or spaces
 }
 # Accept tokens case-insensitively
-VALID_LEVEL_TOKENS: Set[str] = {k.lower() for k in LEVEL_MAP.keys()} | {"na"}
+VALID_LEVEL_TOKENS: FrozenSet[str] = frozenset(k.lower() for k in LEVEL_MAP)
 
 CATALOGS_DIR = pathlib.Path("catalogs")
 
@@ -41,24 +41,32 @@ def get_staged_paths() -> List[pathlib.Path]:
         return []
     return [pathlib.Path(p) for p in out.splitlines() if p]
 
+# ---- file helpers ------------------------------------------------------------
+
+def _read(path: pathlib.Path) -> str:
+    """Read a whole file as UTF-8 without the text-buffering layer."""
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
 # ---- catalog helpers ---------------------------------------------------------
 
-def is_catalog_python(path: pathlib.Path) -> bool:
+def catalog_name_for(path: pathlib.Path) -> Optional[str]:
     """
-    True if path matches catalogs/<catalog>/** and endswith .py
+    catalogs/<catalog>/**/*.py -> <catalog>; None for any other path.
     """
-    parts = path.as_posix().split("/")
-    return len(parts) >= 3 and parts[0] == "catalogs" and path.suffix == ".py"
-
-def catalog_name_for(path: pathlib.Path) -> str:
-    """catalogs/<catalog>/... -> <catalog>"""
-    return path.as_posix().split("/")[1]
+    if path.suffix != ".py":
+        return None
+    parts = path.as_posix().split("/", 2)
+    if len(parts) >= 3 and parts[0] == "catalogs":
+        return parts[1]
+    return None
 
 def group_changed_python_by_catalog(staged: List[pathlib.Path]) -> Dict[str, List[pathlib.Path]]:
     groups: Dict[str, List[pathlib.Path]] = {}
     for p in staged:
-        if is_catalog_python(p):
-            groups.setdefault(catalog_name_for(p), []).append(p)
+        catalog = catalog_name_for(p)
+        if catalog is not None:
+            groups.setdefault(catalog, []).append(p)
     return groups
 
 # ---- commit message parsing & validation -------------------------------------
@@ -66,34 +74,42 @@ def group_changed_python_by_catalog(staged: List[pathlib.Path]) -> Dict[str, Lis
 # <level> <catalog> : file1.py, file2.py;
 SEGMENT_RE = re.compile(
     r"""
-    ^\s*
+    \s*
     (?P<level>major|minor|patch|feat|fix|na)   # level token
     \s+
     (?P<catalog>[A-Za-z0-9._\-]+)              # catalog name
     \s*:\s*
-    (?P<files>.+?)                             # comma-separated files
-    \s*;?\s*$
+    (?P<files>[^;]*[^;\s])                     # comma-separated files (non-blank)
+    \s*(?:;|\Z)
     """,
     re.IGNORECASE | re.VERBOSE,
 )
 
 def parse_commit_segments(msg_text: str) -> List[Tuple[str, str, List[str]]]:
     """
-    Split message by ';' and parse segments.
+    Match SEGMENT_RE at the start of each ';'-separated segment in place,
+    without building the intermediate list of segment strings.
     Returns list of (level_lower, catalog_exact, [file_basenames_lower]).
     """
-    # Normalize whitespace; allow multi-line message content
-    compact = " ".join(line.strip() for line in msg_text.splitlines() if line.strip())
-    raw_segments = [s for s in (seg.strip() for seg in compact.split(";")) if s]
     parsed: List[Tuple[str, str, List[str]]] = []
-    for seg in raw_segments:
-        m = SEGMENT_RE.match(seg)
-        if not m:
+    pos = 0
+    end = len(msg_text)
+    while pos < end:
+        m = SEGMENT_RE.match(msg_text, pos)
+        if m:
+            files_part = m.group("files")
+            lines = files_part.splitlines()
+            if len(lines) > 1:
+                # A file list may wrap across lines; join them with single spaces.
+                files_part = " ".join(line.strip() for line in lines if line.strip())
+            files = [f.strip().lower() for f in files_part.split(",") if f.strip()]
+            parsed.append((m.group("level").lower(), m.group("catalog"), files))
+            pos = m.end()
             continue
-        level = m.group("level").lower()
-        catalog = m.group("catalog")
-        files = [f.strip().lower() for f in m.group("files").split(",") if f.strip()]
-        parsed.append((level, catalog, files))
+        sep = msg_text.find(";", pos)
+        if sep < 0:
+            break
+        pos = sep + 1
     return parsed
 
 def build_guidance(groups: Dict[str, List[pathlib.Path]]) -> str:
@@ -116,31 +132,28 @@ def validate_message_for_groups(msg_text: str, groups: Dict[str, List[pathlib.Pa
       - Token must be in {major,minor,patch,feat,fix,na} (case-insensitive).
       - Every changed file basename for that catalog must be listed in its segment.
     """
-    segments = parse_commit_segments(msg_text)
     if not groups:
         return True, ""
+    segments = parse_commit_segments(msg_text)
     if not segments:
         return False, build_guidance(groups)
 
-    # Build lookup by catalog → listed files (lower)
+    # Build lookup by catalog → listed files (lower), only for changed catalogs.
+    # Any invalid token fails the whole message, so bail out on the first one.
     listed_by_catalog: Dict[str, Set[str]] = {}
-    valid_tokens_all = True
-
     for level, catalog, files in segments:
-        if level.lower() not in VALID_LEVEL_TOKENS:
-            valid_tokens_all = False
-        listed_by_catalog.setdefault(catalog, set()).update(files)
+        if level not in VALID_LEVEL_TOKENS:
+            return False, build_guidance(groups)
+        if catalog in groups:
+            listed_by_catalog.setdefault(catalog, set()).update(files)
 
-    if not valid_tokens_all:
+    if len(listed_by_catalog) != len(groups):
         return False, build_guidance(groups)
 
     # Validate coverage for each changed catalog
     for catalog, paths in groups.items():
-        if catalog not in listed_by_catalog:
-            return False, build_guidance(groups)
         expected_files = {p.name.lower() for p in paths}
-        listed = listed_by_catalog.get(catalog, set())
-        if not expected_files.issubset(listed):
+        if not expected_files.issubset(listed_by_catalog[catalog]):
             return False, build_guidance(groups)
 
     return True, ""
@@ -162,12 +175,12 @@ def main():
     if not args.msg_file:
         sys.exit(0)
 
-    msg_path = pathlib.Path(args.msg_file)
-    if not msg_path.exists():
+    try:
+        msg_text = _read(pathlib.Path(args.msg_file))
+    except FileNotFoundError:
         print("commit message file not found.", file=sys.stderr)
         sys.exit(1)
 
-    msg_text = msg_path.read_text(encoding="utf-8")
     ok, error = validate_message_for_groups(msg_text, groups)
     if not ok:
         print(error, file=sys.stderr)
@@ -0,0 +1,102 @@
+import pathlib
+import unittest
+
+from semantic_versioning import catalog_name_for, parse_commit_segments, validate_message_for_groups
+
+
+class CatalogNameForTest(unittest.TestCase):
+
+    def test_python_file_under_catalog(self):
+        self.assertEqual(catalog_name_for(pathlib.Path("catalogs/catalog_alpha/bulk_load/steam.py")), "catalog_alpha")
+
+    def test_non_catalog_paths_are_ignored(self):
+        for p in ("catalogs/steam.py", "scripts/steam.py", "catalogs/catalog_alpha/version.txt"):
+            self.assertIsNone(catalog_name_for(pathlib.Path(p)))
+
+    def test_dotfile_named_py_is_not_python(self):
+        # Path(".py").suffix == "", so a bare ".py" dotfile is not a Python source.
+        self.assertIsNone(catalog_name_for(pathlib.Path("catalogs/catalog_alpha/.py")))
+
+
+class ParseCommitSegmentsTest(unittest.TestCase):
+
+    def test_multi_line_file_list(self):
+        msg = "major catalog_alpha : steam.py,\n  other.py;\r\nfeat catalog_beta : load.py;\n"
+        self.assertEqual(
+            parse_commit_segments(msg),
+            [
+                ("major", "catalog_alpha", ["steam.py", "other.py"]),
+                ("feat", "catalog_beta", ["load.py"]),
+            ],
+        )
+
+    def test_form_feed_and_vertical_tab_break_lines(self):
+        self.assertEqual(
+            parse_commit_segments("fix catalog_alpha : a.py\x0cb.py;major catalog_beta : c.py,\x0bd.py"),
+            [
+                ("fix", "catalog_alpha", ["a.py b.py"]),
+                ("major", "catalog_beta", ["c.py", "d.py"]),
+            ],
+        )
+
+    def test_missing_trailing_semicolon(self):
+        self.assertEqual(
+            parse_commit_segments("fix catalog_gamma : Kafka.py"),
+            [("fix", "catalog_gamma", ["kafka.py"])],
+        )
+
+    def test_leading_summary_chunk_is_skipped(self):
+        msg = "Tidy loaders; patch catalog_beta : load.py;"
+        self.assertEqual(
+            parse_commit_segments(msg),
+            [("patch", "catalog_beta", ["load.py"])],
+        )
+
+    def test_summary_line_without_separator_swallows_segment(self):
+        self.assertEqual(parse_commit_segments("Tidy loaders\nmajor catalog_alpha : steam.py;"), [])
+
+    def test_words_containing_tokens_do_not_count(self):
+        self.assertEqual(parse_commit_segments("prefix catalog_alpha : steam.py;"), [])
+        self.assertEqual(parse_commit_segments("fixes catalog_alpha : steam.py;"), [])
+
+    def test_empty_file_list_is_not_a_segment(self):
+        self.assertEqual(parse_commit_segments("fix catalog_alpha : \n"), [])
+        self.assertEqual(parse_commit_segments("major catalog_alpha : ;minor catalog_beta : load.py"),
+                         [("minor", "catalog_beta", ["load.py"])])
+
+
+class ValidateMessageForGroupsTest(unittest.TestCase):
+
+    GROUPS = {
+        "catalog_alpha": [
+            pathlib.Path("catalogs/catalog_alpha/bulk_load/steam.py"),
+            pathlib.Path("catalogs/catalog_alpha/other.py"),
+        ],
+        "catalog_beta": [pathlib.Path("catalogs/catalog_beta/kafka_load/load.py")],
+    }
+
+    def test_full_coverage_passes(self):
+        msg = "minor catalog_alpha : steam.py, other.py; fix catalog_beta : load.py;"
+        self.assertEqual(validate_message_for_groups(msg, self.GROUPS), (True, ""))
+
+    def test_unchanged_catalog_does_not_stand_in_for_missing_one(self):
+        msg = "minor catalog_alpha : steam.py, other.py; patch catalog_gamma : kafka.py;"
+        ok, error = validate_message_for_groups(msg, self.GROUPS)
+        self.assertFalse(ok)
+        self.assertIn("catalog_beta", error)
+
+    def test_segments_for_same_catalog_combine(self):
+        msg = "minor catalog_alpha : steam.py; patch catalog_alpha : other.py; fix catalog_beta : load.py;"
+        self.assertEqual(validate_message_for_groups(msg, self.GROUPS), (True, ""))
+
+    def test_partial_file_coverage_fails(self):
+        msg = "minor catalog_alpha : steam.py; fix catalog_beta : load.py;"
+        ok, _ = validate_message_for_groups(msg, self.GROUPS)
+        self.assertFalse(ok)
+
+    def test_no_changed_catalogs_accepts_anything(self):
+        self.assertEqual(validate_message_for_groups(";; not a segment ::", {}), (True, ""))
+
+
+if __name__ == "__main__":
+    unittest.main()